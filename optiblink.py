@@ -2658,14 +2658,35 @@ def prompt_phone_number_update():
 
 
 def main():
-    # Show splash screen first
+    print("🚀 OptiBlink - Eye Tracking Morse Code Interface")
+    print("=" * 50)
+    
+    def load_systems(report):
+        # Initialize camera immediately
+        report(10, "Initializing camera...")
+        print("📹 Initializing camera...")
+        cap = cv2.VideoCapture(0)
+
+        # Initialize systems with comprehensive stderr suppression
+        report(40, "Loading AI models...")
+        print("🧠 Loading AI models and systems...")
+        
+        # CRITICAL: Keep boot-time stderr suppression active
+        # TensorFlow Lite XNNPACK delegate loads on FIRST USE, not on import!
+        # Solution: Never restore stderr, keep it suppressed permanently during runtime
+        
+        with _suppress_all_warnings():
+            auto = AutoCompleteSystem()
+            report(60, "Setting up eye tracking...")
+            eye_tracker = EyeTracker(auto)
+        report(95, "Finalizing setup...")
+        return cap, auto, eye_tracker
+    
+    # Show the splash screen while the camera and AI models load in the background
     if SPLASH_AVAILABLE:
-        try:
-            # Show splash screen (blocking, not threaded)
-            from splash_screen import show_splash_screen
-            show_splash_screen(duration=3.0)
-        except Exception as e:
-            print(f"Warning: Could not show splash screen: {e}")
+        cap, auto, eye_tracker = show_splash_screen_threaded(loader=load_systems)
+    else:
+        cap, auto, eye_tracker = load_systems(lambda progress, status_text="": None)
     
     # Show emergency contact dialog ONLY on first run (when no config file exists)
     try:
@@ -2695,29 +2716,19 @@ def main():
     except Exception as e:
         print(f"Warning: First-run emergency contact dialog failed: {e}")
     
-    print("🚀 OptiBlink - Eye Tracking Morse Code Interface")
-    print("=" * 50)
+    # Release the Tk root shared by the splash screen and first-run dialog
+    if SPLASH_AVAILABLE:
+        try:
+            from splash_screen import close_shared_root
+            close_shared_root()
+        except Exception as e:
+            print(f"Warning: Could not close splash screen window: {e}")
     
     # Load config silently - no prompts at startup
     current_config = load_config()
     emergency_contact = current_config.get('emergency_contact', 'Not configured')
     print(f"📞 Emergency contact: {emergency_contact} (Click phone icon to update)")
     
-    # Initialize camera immediately
-    print("📹 Initializing camera...")
-    cap = cv2.VideoCapture(0)
-
-    # Initialize systems with comprehensive stderr suppression
-    print("🧠 Loading AI models and systems...")
-    
-    # CRITICAL: Keep boot-time stderr suppression active
-    # TensorFlow Lite XNNPACK delegate loads on FIRST USE, not on import!
-    # Solution: Never restore stderr, keep it suppressed permanently during runtime
-    
-    with _suppress_all_warnings():
-        auto = AutoCompleteSystem()
-        eye_tracker = EyeTracker(auto)
-    
     print("✅ OptiBlink ready!")
     
     # OPTION: Keep stderr permanently suppressed to prevent ANY future warnings
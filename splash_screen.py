@@ -4,12 +4,19 @@ Displays a splash screen with the OptiBlink logo during application startup.
 """
 
 import tkinter as tk
-from tkinter import ttk
+import concurrent.futures
+import functools
+import logging
 import os
+import queue
+import re
 import sys
 import threading
-import time
-from PIL import Image, ImageTk
+
+logger = logging.getLogger(__name__)
+
+# Phone number: optional leading '+', digits with optional spaces/dashes between
+_PHONE_RE = re.compile(r"^\+?\d[\d\s\-]{8,}\d$")
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and PyInstaller."""
@@ -19,6 +26,188 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+# Hidden Tk root shared by the splash screen and dialogs so they don't each
+# start a Tk interpreter (and can share cached logo images)
+_shared_root = None
+
+def _get_shared_root():
+    """Return the hidden Tk root, creating it on first use"""
+    global _shared_root
+    if _shared_root is None:
+        _shared_root = tk.Tk()
+        _shared_root.withdraw()
+    return _shared_root
+
+# Logo PhotoImages keyed by (size_px, master); also keeps strong references
+# so Tk doesn't garbage collect them
+_logo_cache = {}
+
+def close_shared_root():
+    """
+    Destroy the shared Tk root once the splash screen and dialogs are done
+    
+    Also drops the logo images and style state bound to it, so a later call
+    to the splash or dialog starts from a fresh root.
+    """
+    global _shared_root, _styled_root
+    if _shared_root is None:
+        return
+    _logo_cache.clear()
+    _logo_futures.clear()
+    _styled_root = None
+    try:
+        _shared_root.destroy()
+    except tk.TclError:
+        pass
+    _shared_root = None
+
+@functools.lru_cache(maxsize=None)
+def _log_pillow_version():
+    """Log the Pillow version once, to tell plain Pillow and Pillow-SIMD builds apart"""
+    import PIL
+    # Pillow-SIMD releases usually carry a ".postN" suffix, but that is only a hint
+    logger.debug("Loading logo with Pillow %s", PIL.__version__)
+
+def _decode_logo_pil(size_px):
+    """
+    Decode the OptiBlink logo into a PIL image of the given size
+    
+    Safe to call off the Tk thread since it does not touch Tk.
+
+    Args:
+        size_px (int): Width and height of the logo in pixels
+
+    Returns:
+        PIL.Image.Image or None if the logo could not be loaded
+    """
+    try:
+        # Imported on first use so the splash window can appear before Pillow loads
+        from PIL import Image, UnidentifiedImageError
+        _log_pillow_version()
+        
+        target_size = (size_px, size_px)
+        
+        # Prefer the logo pre-sized for this display size (no resize needed)
+        try:
+            pil_image = Image.open(resource_path(f"optiblink-logo-{size_px}.png"),
+                                   formats=("PNG",))
+            pil_image.load()
+        except (FileNotFoundError, UnidentifiedImageError):
+            try:
+                pil_image = Image.open(resource_path("optiblink-logo.ico"))
+            except (FileNotFoundError, UnidentifiedImageError):
+                return None
+            if pil_image.format == "ICO" and target_size in pil_image.ico.sizes():
+                # Select the frame already rendered at this size instead of resizing
+                pil_image.size = target_size
+            else:
+                # Let decoders that support it (e.g. JPEG) decode at reduced scale
+                pil_image.draft("RGB", target_size)
+        
+        # Normalize to RGBA once so resizing and PhotoImage skip mode conversion
+        if pil_image.mode != "RGBA":
+            pil_image = pil_image.convert("RGBA")
+        
+        if pil_image.size != target_size:
+            # Small decorative logos don't need the cost of LANCZOS
+            if size_px <= 96:
+                resample = Image.Resampling.BILINEAR
+            else:
+                resample = Image.Resampling.LANCZOS
+            pil_image = pil_image.resize(target_size, resample)
+    except Exception:
+        return None
+    return pil_image
+
+# Pillow fallback decodes started ahead of use, keyed by (size_px, master)
+_logo_futures = {}
+
+def _prefetch_logo(size_px, master):
+    """
+    Start the Pillow fallback decode on a background thread ahead of use
+    
+    Only needed when Tk can't read the pre-sized PNG itself; the decode then
+    overlaps with building the window. Does nothing if the logo is already
+    cached or being decoded.
+
+    Args:
+        size_px (int): Width and height of the logo in pixels
+        master: Tk root the PhotoImage will belong to
+    """
+    key = (size_px, master)
+    if key in _logo_cache or key in _logo_futures:
+        return
+    # Cheap probe only; _load_logo still opens the PNG EAFP-style
+    png_path = resource_path(f"optiblink-logo-{size_px}.png")
+    if tk.TkVersion >= 8.6 and os.path.isfile(png_path):
+        return
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    _logo_futures[key] = executor.submit(_decode_logo_pil, size_px)
+    executor.shutdown(wait=False)
+
+def _load_logo(size_px, master):
+    """
+    Load the OptiBlink logo as a PhotoImage, decoded and resized once per size
+
+    Args:
+        size_px (int): Width and height of the logo in pixels
+        master: Tk root the PhotoImage belongs to
+
+    Returns:
+        tk.PhotoImage, ImageTk.PhotoImage or None if the logo could not be loaded
+    """
+    key = (size_px, master)
+    if key in _logo_cache:
+        return _logo_cache[key]
+    
+    future = _logo_futures.pop(key, None)
+    logo_image = None
+    # Tk 8.6+ reads PNG natively, so the pre-sized logo doesn't need Pillow
+    try:
+        logo_image = tk.PhotoImage(file=resource_path(f"optiblink-logo-{size_px}.png"),
+                                   master=master)
+    except tk.TclError:
+        pil_image = future.result() if future else _decode_logo_pil(size_px)
+        if pil_image is not None:
+            try:
+                from PIL import ImageTk
+                logo_image = ImageTk.PhotoImage(pil_image, master=master)
+            except Exception:
+                logo_image = None
+    _logo_cache[key] = logo_image
+    return logo_image
+
+# Progress values and status messages shown while the splash screen animates
+_SPLASH_STEPS = (
+    (10, "Loading modules..."),
+    (25, "Initializing camera..."),
+    (40, "Loading AI models..."),
+    (60, "Setting up eye tracking..."),
+    (80, "Configuring interface..."),
+    (95, "Finalizing setup..."),
+    (100, "Ready!"),
+)
+
+# Tk root whose ttk style has already been configured
+_styled_root = None
+
+def _configure_style_once(root):
+    """Create the purple progress bar style once per Tk interpreter"""
+    global _styled_root
+    if _styled_root is root:
+        return
+    from tkinter import ttk
+    style = ttk.Style(root)
+    style.theme_use('clam')  # Use clam theme for better customization
+    style.configure("Purple.Horizontal.TProgressbar",
+                   background='#8e44ad',  # Purple color
+                   troughcolor='#ecf0f1',  # Light gray background
+                   borderwidth=2,
+                   relief='solid',
+                   lightcolor='#9b59b6',  # Lighter purple
+                   darkcolor='#7d3c98')   # Darker purple
+    _styled_root = root
+
 class SplashScreen:
     def __init__(self, duration=3.0):
         """
@@ -32,10 +221,17 @@ class SplashScreen:
         self.progress_var = None
         self.progress_bar = None
         self.status_label = None
+        # Progress updates posted from loader threads, applied on the Tk thread
+        self.progress_queue = queue.Queue()
+        self._drain_after_id = None
         
     def create_splash(self):
         """Create and configure the splash screen window"""
-        self.root = tk.Tk()
+        # The splash is a Toplevel of the shared root, which outlives it
+        master = _get_shared_root()
+        # Start any Pillow fallback decode so it overlaps window creation
+        _prefetch_logo(120, master)
+        self.root = tk.Toplevel(master)
         self.root.title("OptiBlink")
         
         # Remove window decorations and make it stay on top
@@ -58,30 +254,19 @@ class SplashScreen:
         main_frame = tk.Frame(self.root, bg='white')
         main_frame.pack(expand=True, fill='both', padx=20, pady=20)
         
+        # Paint the bare window before loading the logo and ttk
+        self.root.update_idletasks()
+        
         # Try to load and display the logo
-        try:
-            # Convert ICO to displayable format
-            logo_path = resource_path("optiblink-logo.ico")
-            if os.path.exists(logo_path):
-                # Load the ICO file and convert to PhotoImage
-                pil_image = Image.open(logo_path)
-                # Resize if needed (keep aspect ratio)
-                pil_image = pil_image.resize((120, 120), Image.Resampling.LANCZOS)
-                logo_image = ImageTk.PhotoImage(pil_image)
-                
-                logo_label = tk.Label(main_frame, image=logo_image, bg='white')
-                logo_label.image = logo_image  # Keep a reference
-                logo_label.pack(pady=(20, 10))
-            else:
-                # Fallback if logo not found
-                logo_label = tk.Label(main_frame, text="🔍", font=('Arial', 48), 
-                                    fg='#3498db', bg='white')
-                logo_label.pack(pady=(20, 10))
-        except Exception as e:
-            # Fallback if image loading fails
+        logo_image = _load_logo(120, master)
+        if logo_image is not None:
+            logo_label = tk.Label(main_frame, image=logo_image, bg='white')
+            logo_label.image = logo_image  # Keep a reference
+        else:
+            # Fallback if logo not found or loading fails
             logo_label = tk.Label(main_frame, text="🔍", font=('Arial', 48), 
                                 fg='#3498db', bg='white')
-            logo_label.pack(pady=(20, 10))
+        logo_label.pack(pady=(20, 10))
         
         # Application name
         title_label = tk.Label(main_frame, text="OptiBlink", 
@@ -104,16 +289,8 @@ class SplashScreen:
         # Progress bar
         self.progress_var = tk.DoubleVar()
         
-        # Create a custom style for purple progress bar
-        style = ttk.Style()
-        style.theme_use('clam')  # Use clam theme for better customization
-        style.configure("Purple.Horizontal.TProgressbar",
-                       background='#8e44ad',  # Purple color
-                       troughcolor='#ecf0f1',  # Light gray background
-                       borderwidth=2,
-                       relief='solid',
-                       lightcolor='#9b59b6',  # Lighter purple
-                       darkcolor='#7d3c98')   # Darker purple
+        from tkinter import ttk
+        _configure_style_once(master)
         
         self.progress_bar = ttk.Progressbar(main_frame, 
                                           variable=self.progress_var,
@@ -144,11 +321,8 @@ class SplashScreen:
             try:
                 self.progress_var.set(value)
                 if status_text:
-                    # Force text update with multiple methods
                     self.status_label.config(text=status_text)
-                    self.status_label.update()
                 self.root.update_idletasks()
-                self.root.update()
             except Exception as e:
                 print(f"Error updating progress: {e}")
     
@@ -164,39 +338,68 @@ class SplashScreen:
         
         # Show the window
         self.root.deiconify()
-        self.root.update()
         
         # Animate progress
-        steps = [
-            (10, "Loading modules..."),
-            (25, "Initializing camera..."),
-            (40, "Loading AI models..."),
-            (60, "Setting up eye tracking..."),
-            (80, "Configuring interface..."),
-            (95, "Finalizing setup..."),
-            (100, "Ready!")
-        ]
-        
-        step_duration = self.duration / len(steps)
-        
-        for progress, status in steps:
-            print(f"Updating progress: {progress}% - {status}")  # Debug output
+        step_ms = self.duration * 1000 / len(_SPLASH_STEPS)
+        
+        def run_step(progress, status):
+            logger.debug("Updating progress: %s%% - %s", progress, status)
             self.update_progress(progress, status)
-            time.sleep(step_duration)
         
-        # Keep final state visible briefly
-        time.sleep(0.5)
+        for i, (progress, status) in enumerate(_SPLASH_STEPS):
+            self.root.after(int(step_ms * i),
+                            lambda p=progress, s=status: run_step(p, s))
         
-        # Close splash screen
-        self.close_splash()
+        # Keep final state visible briefly, then close splash screen
+        self.root.after(int(step_ms * len(_SPLASH_STEPS)) + 500, self.close_splash)
+        
+        self._drain_progress_queue()
+        self.root.wait_window()
         
         # Call callback if provided
         if callback:
             callback()
     
+    def post_progress(self, value, status_text=""):
+        """
+        Queue a progress update from the application's own loading code
+        
+        Safe to call from any thread; the update is applied on the Tk thread.
+        
+        Args:
+            value (float): Progress value between 0 and 100
+            status_text (str): Status message to display
+        """
+        self.progress_queue.put((value, status_text))
+    
+    def finish_progress(self):
+        """Queue the final "Ready!" update and close the splash shortly after"""
+        self.progress_queue.put(None)
+    
+    def _drain_progress_queue(self):
+        """Apply queued progress updates, polling every 50 ms while shown"""
+        self._drain_after_id = None
+        if not self.root:
+            return
+        try:
+            while True:
+                item = self.progress_queue.get_nowait()
+                if item is None:
+                    self.update_progress(100, "Ready!")
+                    # Keep final state visible briefly
+                    self.root.after(500, self.close_splash)
+                    return
+                self.update_progress(*item)
+        except queue.Empty:
+            pass
+        self._drain_after_id = self.root.after(50, self._drain_progress_queue)
+    
     def close_splash(self):
-        """Close the splash screen"""
+        """Close the splash screen (the shared Tk root is kept alive)"""
         if self.root:
+            if self._drain_after_id:
+                self.root.after_cancel(self._drain_after_id)
+                self._drain_after_id = None
             self.root.destroy()
             self.root = None
 
@@ -205,39 +408,87 @@ def show_splash_screen(duration=3.0, callback=None):
     splash = SplashScreen(duration)
     splash.show_splash(callback)
 
-def show_splash_screen_threaded(duration=3.0, callback=None):
+def show_splash_screen_threaded(duration=3.0, callback=None, loader=None):
     """
-    Show splash screen in a separate thread (non-blocking)
+    Show splash screen on the main thread while loading runs in a worker thread
+    
+    Tk is not thread-safe, so the splash window always lives on the calling
+    (main) thread. The loader runs on a daemon thread and reports progress
+    through a queue that the splash drains from the Tk event loop. The splash
+    closes once the loader returns.
     
     Args:
-        duration (float): Duration in seconds
+        duration (float): Duration in seconds of the animation used when no
+            loader is given
         callback: Function to call when done
+        loader: Function run on a worker thread; it is passed a
+            report(progress, status_text) function for progress updates
+    
+    Returns:
+        The loader's return value (None if no loader was given). An exception
+        raised by the loader is re-raised here once the splash has closed.
     """
-    def run_splash():
-        splash = SplashScreen(duration)
+    splash = SplashScreen(duration)
+    if loader is None:
         splash.show_splash(callback)
+        return None
+    
+    try:
+        splash.create_splash()
+    except tk.TclError as e:
+        # No display for the splash screen; load without it
+        print(f"Error creating splash screen: {e}")
+        result = loader(lambda progress, status_text="": None)
+        if callback:
+            callback()
+        return result
     
-    thread = threading.Thread(target=run_splash, daemon=True)
+    outcome = {}
+    
+    def run_loader():
+        try:
+            outcome['result'] = loader(splash.post_progress)
+        except BaseException as e:
+            outcome['error'] = e
+        finally:
+            splash.finish_progress()
+    
+    thread = threading.Thread(target=run_loader, daemon=True)
     thread.start()
-    return thread
+    
+    splash._drain_progress_queue()
+    splash.root.wait_window()
+    thread.join()
+    
+    if 'error' in outcome:
+        raise outcome['error']
+    if callback:
+        callback()
+    return outcome.get('result')
 
-def show_emergency_contact_dialog():
+def show_emergency_contact_dialog(master=None):
     """
     Show a dialog window asking for user's emergency contact
     
+    Args:
+        master: Tk root to attach the dialog to (shared hidden root if None)
+    
     Returns:
         dict: Contains 'contact' and 'whatsapp_preference' or None if cancelled
     """
     import tkinter as tk
     from tkinter import messagebox, simpledialog
     
-    # Create main dialog window
-    dialog = tk.Tk()
+    if master is None:
+        master = _get_shared_root()
+    
+    # Create main dialog window (hidden until all widgets are laid out)
+    dialog = tk.Toplevel(master)
+    dialog.withdraw()
     dialog.title("Emergency Contact Setup")
-    dialog.geometry("450x550")
     dialog.resizable(False, False)
     
-    # Center the window
+    # Size and center the window in a single geometry call
     screen_width = dialog.winfo_screenwidth()
     screen_height = dialog.winfo_screenheight()
     x = (screen_width - 450) // 2
@@ -251,40 +502,27 @@ def show_emergency_contact_dialog():
     # Result storage
     result = {'contact': '', 'whatsapp_preference': False, 'cancelled': True}
     
-    # Main frame
+    # Main frame, laid out with a single grid
     main_frame = tk.Frame(dialog, bg='white', padx=30, pady=15)
     main_frame.pack(expand=True, fill='both')
+    main_frame.grid_columnconfigure(0, weight=1)
     
     # Logo
-    try:
-        # Load and display the OptiBlink logo
-        logo_path = resource_path("optiblink-logo.ico")
-        if os.path.exists(logo_path):
-            # Load the ICO file and convert to PhotoImage
-            pil_image = Image.open(logo_path)
-            # Resize for dialog (smaller than splash screen)
-            pil_image = pil_image.resize((80, 80), Image.Resampling.LANCZOS)
-            logo_image = ImageTk.PhotoImage(pil_image)
-            
-            logo_label = tk.Label(main_frame, image=logo_image, bg='white')
-            logo_label.image = logo_image  # Keep a reference
-            logo_label.pack(pady=(10, 15))
-        else:
-            # Fallback if logo not found
-            logo_label = tk.Label(main_frame, text="🔍", font=('Arial', 32), 
-                                fg='#3498db', bg='white')
-            logo_label.pack(pady=(10, 15))
-    except Exception as e:
-        # Fallback if image loading fails
+    logo_image = _load_logo(80, master)
+    if logo_image is not None:
+        logo_label = tk.Label(main_frame, image=logo_image, bg='white')
+        logo_label.image = logo_image  # Keep a reference
+    else:
+        # Fallback if logo not found or loading fails
         logo_label = tk.Label(main_frame, text="🔍", font=('Arial', 32), 
                             fg='#3498db', bg='white')
-        logo_label.pack(pady=(10, 15))
+    logo_label.grid(row=0, column=0, pady=(10, 15))
     
     # Title
     title_label = tk.Label(main_frame, text="Welcome to OptiBlink.\nEmergency Contact Setup", 
                           font=('Arial', 16, 'bold'), 
                           fg='#2c3e50', bg='white')
-    title_label.pack(pady=(0, 10))
+    title_label.grid(row=1, column=0, pady=(0, 10))
     
     # Description
     desc_label = tk.Label(main_frame, 
@@ -292,48 +530,46 @@ def show_emergency_contact_dialog():
                          font=('Arial', 10), 
                          fg='#34495e', bg='white',
                          justify='center')
-    desc_label.pack(pady=(0, 20))
-    
-    # Phone number frame
-    phone_frame = tk.Frame(main_frame, bg='white')
-    phone_frame.pack(fill='x', pady=(0, 15))
+    desc_label.grid(row=2, column=0, pady=(0, 20))
     
-    phone_label = tk.Label(phone_frame, text="Emergency Contact Number:", 
+    # Phone number
+    phone_label = tk.Label(main_frame, text="Emergency Contact Number:", 
                           font=('Arial', 10, 'bold'), 
                           fg='#2c3e50', bg='white')
-    phone_label.pack(anchor='w')
+    phone_label.grid(row=3, column=0, sticky='w')
     
-    phone_entry = tk.Entry(phone_frame, font=('Arial', 11), width=30, relief='solid', bd=1)
-    phone_entry.pack(fill='x', pady=(5, 0))
+    phone_entry = tk.Entry(main_frame, font=('Arial', 11), width=30, relief='solid', bd=1)
+    phone_entry.grid(row=4, column=0, sticky='ew', pady=(5, 0))
     phone_entry.insert(0, "+91 ")  # Default country code
     
     # Example text
-    example_label = tk.Label(phone_frame, text="Example: +91 9876543210", 
+    example_label = tk.Label(main_frame, text="Example: +91 9876543210", 
                             font=('Arial', 9), 
                             fg='#7f8c8d', bg='white')
-    example_label.pack(anchor='w', pady=(2, 0))
-    
-    # WhatsApp preference frame
-    whatsapp_frame = tk.Frame(main_frame, bg='white')
-    whatsapp_frame.pack(fill='x', pady=(10, 20))
+    example_label.grid(row=5, column=0, sticky='w', pady=(2, 15))
     
+    # WhatsApp preference
     whatsapp_var = tk.BooleanVar()
-    whatsapp_check = tk.Checkbutton(whatsapp_frame, 
+    whatsapp_check = tk.Checkbutton(main_frame, 
                                    text="Prefer WhatsApp Web for emergency alerts", 
                                    variable=whatsapp_var,
                                    font=('Arial', 10), 
                                    fg='#2c3e50', bg='white',
                                    activebackground='white')
-    whatsapp_check.pack(anchor='w')
+    whatsapp_check.grid(row=6, column=0, sticky='w', pady=(10, 20))
+    
+    # Empty row that absorbs spare height so the buttons sit at the bottom
+    main_frame.grid_rowconfigure(7, weight=1)
     
     # Button frame
     button_frame = tk.Frame(main_frame, bg='white')
-    button_frame.pack(side='bottom', fill='x', pady=(20, 10))
+    button_frame.grid(row=8, column=0, sticky='e', pady=(20, 10))
     
     def ok_proceed():
         contact = phone_entry.get().strip()
-        if len(contact) < 10:
-            messagebox.showerror("Invalid Contact", "Please enter a valid phone number with at least 10 digits.")
+        if not _PHONE_RE.match(contact) or sum(c.isdigit() for c in contact) < 10:
+            messagebox.showerror("Invalid Contact", "Please enter a valid phone number with at least 10 digits.",
+                                 parent=dialog)
             return
         
         result['contact'] = contact
@@ -354,7 +590,7 @@ def show_emergency_contact_dialog():
                       highlightbackground='#27ae60',
                       padx=30, pady=8,
                       cursor='hand2')
-    ok_btn.pack(side='right', padx=(10, 0))
+    ok_btn.grid(row=0, column=1, padx=(10, 0))
     
     cancel_btn = tk.Button(button_frame, text="Cancel", 
                           command=cancel_close,
@@ -364,7 +600,7 @@ def show_emergency_contact_dialog():
                           highlightbackground='#e74c3c',
                           padx=30, pady=8,
                           cursor='hand2')
-    cancel_btn.pack(side='right')
+    cancel_btn.grid(row=0, column=0)
     
     # Focus on phone entry
     phone_entry.focus_set()
@@ -377,8 +613,14 @@ def show_emergency_contact_dialog():
     
     dialog.protocol("WM_DELETE_WINDOW", on_closing)
     
-    # Run dialog
-    dialog.mainloop()
+    # Lay out once with everything in place, then show the dialog
+    dialog.update_idletasks()
+    dialog.deiconify()
+    
+    # Run dialog modally until it is closed
+    dialog.wait_visibility()
+    dialog.grab_set()
+    master.wait_window(dialog)
     
     return result if not result['cancelled'] else None
 